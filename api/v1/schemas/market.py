@@ -7,12 +7,16 @@
 
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class RecommendationItem(BaseModel):
     """单只推荐股票"""
 
+    # 构造后只读：推荐条目在缓存中被多个请求共享，禁止原地修改；
+    # 筛选结果中多余的键直接忽略
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
     name: str = Field(..., description="股票名称")
     code: str = Field(..., description="股票代码")
     price: float = Field(..., description="最新价")
@@ -32,23 +36,22 @@ class MarketRecommendationsResponse(BaseModel):
     watch: List[RecommendationItem] = Field(default_factory=list, description="观察推荐")
     updated_at: str = Field(..., description="数据更新时间")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "buy": [
-                    {
-                        "name": "示例股票",
-                        "code": "600519",
-                        "price": 1800.0,
-                        "change_pct": 3.5,
-                        "volume_ratio": 2.1,
-                        "turnover_rate": 1.2,
-                        "pe": 35,
-                        "market_cap": "22625亿",
-                        "reason": "今日涨3.5%，量比2.1（放量），换手1.2%",
-                    }
-                ],
-                "watch": [],
-                "updated_at": "2025-02-11 15:00:00",
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "buy": [
+                {
+                    "name": "示例股票",
+                    "code": "600519",
+                    "price": 1800.0,
+                    "change_pct": 3.5,
+                    "volume_ratio": 2.1,
+                    "turnover_rate": 1.2,
+                    "pe": 35,
+                    "market_cap": "22625亿",
+                    "reason": "今日涨3.5%，量比2.1（放量），换手1.2%",
+                }
+            ],
+            "watch": [],
+            "updated_at": "2025-02-11 15:00:00",
         }
+    })
@@ -44,7 +44,7 @@ from tenacity import (
 
 from src.patches.eastmoney_patch import eastmoney_patch
 from src.config import get_config
-from .base import BaseFetcher, DataFetchError, RateLimitError, STANDARD_COLUMNS, is_bse_code, is_st_stock, is_kc_cy_stock, normalize_stock_code
+from .base import BaseFetcher, DataFetchError, RateLimitError, STANDARD_COLUMNS, calc_market_stats, find_cached_quote_row, is_bse_code
 from .realtime_types import (
     UnifiedRealtimeQuote, ChipDistribution, RealtimeSource,
     get_realtime_circuit_breaker, get_chip_circuit_breaker,
@@ -65,6 +65,19 @@ _AKSHARE_HISTORY_CALL_TIMEOUT = 30.0
 _AKSHARE_TIMEOUT_PROCESS_JOIN_GRACE = 1.0
 _AKSHARE_TIMEOUT_PROCESS_START_METHOD = "spawn"
 
+# 日线列名映射（Akshare 中文列名 -> 标准英文列名）及标准化后保留的列
+_DAILY_COLUMN_MAPPING = {
+    '日期': 'date',
+    '开盘': 'open',
+    '收盘': 'close',
+    '最高': 'high',
+    '最低': 'low',
+    '成交量': 'volume',
+    '成交额': 'amount',
+    '涨跌幅': 'pct_chg',
+}
+_DAILY_KEEP_COLUMNS = ('code', *STANDARD_COLUMNS)
+
 
 # User-Agent 池，用于随机轮换
 USER_AGENTS = [
@@ -835,29 +848,14 @@ class AkshareFetcher(BaseFetcher):
         需要映射到标准列名：
         date, open, high, low, close, volume, amount, pct_chg
         """
-        df = df.copy()
-        
-        # 列名映射（Akshare 中文列名 -> 标准英文列名）
-        column_mapping = {
-            '日期': 'date',
-            '开盘': 'open',
-            '收盘': 'close',
-            '最高': 'high',
-            '最低': 'low',
-            '成交量': 'volume',
-            '成交额': 'amount',
-            '涨跌幅': 'pct_chg',
-        }
-        
         # 重命名列
-        df = df.rename(columns=column_mapping)
+        df = df.rename(columns=_DAILY_COLUMN_MAPPING)
         
         # 添加股票代码列
         df['code'] = stock_code
         
         # 只保留需要的列
-        keep_cols = ['code'] + STANDARD_COLUMNS
-        existing_cols = [col for col in keep_cols if col in df.columns]
+        existing_cols = [col for col in _DAILY_KEEP_COLUMNS if col in df.columns]
         df = df[existing_cols]
         
         return df
@@ -966,13 +964,11 @@ class AkshareFetcher(BaseFetcher):
                 return None
             
             # 查找指定股票
-            row = df[df['代码'] == stock_code]
-            if row.empty:
+            row = find_cached_quote_row(_realtime_cache, df, '代码', stock_code)
+            if row is None:
                 logger.info(f"[API返回] 未找到股票 {stock_code} 的实时行情")
                 return None
             
-            row = row.iloc[0]
-            
             # 使用 realtime_types.py 中的统一转换函数
             quote = UnifiedRealtimeQuote(
                 code=stock_code,
@@ -1369,13 +1365,11 @@ class AkshareFetcher(BaseFetcher):
                 return None
             
             # 查找指定 ETF
-            row = df[df['代码'] == stock_code]
-            if row.empty:
+            row = find_cached_quote_row(_etf_realtime_cache, df, '代码', stock_code)
+            if row is None:
                 logger.info(f"[API返回] 未找到 ETF {stock_code} 的实时行情")
                 return None
             
-            row = row.iloc[0]
-            
             # 使用 realtime_types.py 中的统一转换函数
             # ETF 行情数据构建
             quote = UnifiedRealtimeQuote(
@@ -1670,7 +1664,7 @@ class AkshareFetcher(BaseFetcher):
                     row = df[df['代码'] == code]
                     if row.empty:
                         # 尝试带前缀查找
-                        row = df[df['代码'].str.contains(code)]
+                        row = df[df['代码'].str.contains(code, regex=False)]
 
                     if not row.empty:
                         row = row.iloc[0]
@@ -1745,89 +1739,7 @@ class AkshareFetcher(BaseFetcher):
         df: pd.DataFrame,
         ) -> Optional[Dict[str, Any]]:
         """从行情 DataFrame 计算涨跌统计。"""
-        import numpy as np
-
-        df = df.copy()
-        
-        # 1. 提取基础比对数据：最新价、昨收
-        # 兼容不同接口返回的列名 sina/em efinance tushare xtdata
-        code_col = next((c for c in ['代码', '股票代码', 'ts_code','stock_code'] if c in df.columns), None)
-        name_col = next((c for c in ['名称', '股票名称','name','name'] if c in df.columns), None)
-        close_col = next((c for c in ['最新价', '最新价', 'close','lastPrice'] if c in df.columns), None)
-        pre_close_col = next((c for c in ['昨收', '昨日收盘', 'pre_close','lastClose'] if c in df.columns), None)
-        amount_col = next((c for c in ['成交额', '成交额', 'amount','amount'] if c in df.columns), None) 
-        
-        limit_up_count = 0
-        limit_down_count = 0
-        up_count = 0
-        down_count = 0
-        flat_count = 0
-
-        for code, name, current_price, pre_close, amount in zip(
-            df[code_col], df[name_col], df[close_col], df[pre_close_col], df[amount_col]
-        ):
-            
-            # 停牌过滤 efinance 的停牌数据有时候会缺失价格显示为 '-'，em 显示为none
-            if pd.isna(current_price) or pd.isna(pre_close) or current_price in ['-'] or pre_close in ['-'] or amount == 0:
-                continue
-            
-            # em、efinance 为str 需要转换为float
-            current_price = float(current_price)
-            pre_close = float(pre_close)
-            
-            # 获取去除前缀的纯数字代码
-            pure_code = normalize_stock_code(str(code)) 
-
-            # A. 确定每只股票的涨跌幅比例 (使用纯数字代码判断)
-            if is_bse_code(pure_code): 
-                ratio = 0.30
-            elif is_kc_cy_stock(pure_code): #pure_code.startswith(('688', '30')):
-                ratio = 0.20
-            elif is_st_stock(name): #'ST' in str_name:
-                ratio = 0.05
-            else:
-                ratio = 0.10
-
-            # B. 严格按照 A 股规则计算涨跌停价：昨收 * (1 ± 比例) -> 四舍五入保留2位小数
-            limit_up_price = np.floor(pre_close * (1 + ratio) * 100 + 0.5) / 100.0
-            limit_down_price = np.floor(pre_close * (1 - ratio) * 100 + 0.5) / 100.0
-
-            limit_up_price_Tolerance = round(abs(pre_close * (1 + ratio) - limit_up_price), 10)
-            limit_down_price_Tolerance = round(abs(pre_close * (1 - ratio) - limit_down_price), 10)
-
-            # C. 精确比对
-            if current_price > 0 :
-                is_limit_up = (current_price > 0) and (abs(current_price - limit_up_price) <= limit_up_price_Tolerance)
-                is_limit_down = (current_price > 0) and (abs(current_price - limit_down_price) <= limit_down_price_Tolerance)
-
-                if is_limit_up:
-                    limit_up_count += 1
-                if is_limit_down:
-                    limit_down_count += 1
-
-                if current_price > pre_close:
-                    up_count += 1
-                elif current_price < pre_close:
-                    down_count += 1
-                else:
-                    flat_count += 1
-                
-        # 统计数量
-        stats = {
-            'up_count': up_count,
-            'down_count': down_count,
-            'flat_count': flat_count,
-            'limit_up_count': limit_up_count,
-            'limit_down_count': limit_down_count,
-            'total_amount': 0.0,
-        }
-        
-        # 成交额统计
-        if amount_col and amount_col in df.columns:
-            df[amount_col] = pd.to_numeric(df[amount_col], errors='coerce')
-            stats['total_amount'] = (df[amount_col].sum() / 1e8)
-            
-        return stats
+        return calc_market_stats(df)
 
     def get_sector_rankings(self, n: int = 5) -> Optional[Tuple[List[Dict], List[Dict]]]:
         """
@@ -293,8 +293,6 @@ class BaostockFetcher(BaseFetcher):
         需要映射到标准列名：
         date, open, high, low, close, volume, amount, pct_chg
         """
-        df = df.copy()
-        
         # 列名映射（只需要处理 pctChg）
         column_mapping = {
             'pctChg': 'pct_chg',
@@ -394,8 +392,7 @@ class BaostockFetcher(BaseFetcher):
                         # 更新缓存
                         if not hasattr(self, '_stock_name_cache'):
                             self._stock_name_cache = {}
-                        for _, row in df.iterrows():
-                            self._stock_name_cache[row['code']] = row['name']
+                        self._stock_name_cache.update(zip(df['code'], df['name']))
                         
                         logger.info(f"Baostock 获取股票列表成功: {len(df)} 条")
                         return df[['code', 'name']]
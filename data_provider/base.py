@@ -270,6 +270,101 @@ def canonical_stock_code(code: str) -> str:
     return (code or "").strip().upper()
 
 
+def find_cached_quote_row(
+    cache: Dict[str, Any],
+    df: pd.DataFrame,
+    code_col: str,
+    code: str,
+) -> Optional[pd.Series]:
+    """
+    Look up the first row of ``df`` whose ``code_col`` equals ``code``.
+
+    ``df`` is the full-market spot frame held in a fetcher's realtime cache. The
+    code -> row position index is built once per cached frame and stored on the
+    cache dict as a single ``(df, code_col, index)`` tuple, so concurrent workers
+    either see a complete index for the current frame or rebuild it.
+    """
+    entry = cache.get('code_index')
+    if entry is None or entry[0] is not df or entry[1] != code_col:
+        index: Dict[Any, int] = {}
+        for pos, value in enumerate(df[code_col].tolist()):
+            index.setdefault(value, pos)
+        entry = (df, code_col, index)
+        cache['code_index'] = entry
+    pos = entry[2].get(code)
+    return None if pos is None else df.iloc[pos]
+
+
+def _limit_ratio(pure_code: str, name: str) -> float:
+    """Daily price-limit ratio for an A-share code/name (BSE 30%, STAR/ChiNext 20%, ST 5%, else 10%)."""
+    if is_bse_code(pure_code):
+        return 0.30
+    if is_kc_cy_stock(pure_code):
+        return 0.20
+    if is_st_stock(name):
+        return 0.05
+    return 0.10
+
+
+def calc_market_stats(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Compute A-share market breadth (up/down/flat, limit up/down, total amount) from a quote frame.
+
+    Suspended rows (missing price / previous close, '-' placeholders, zero amount) are
+    skipped for the price statistics. Prices are compared as whole numpy columns; only
+    the per-stock limit ratio, which depends on code/name rules, is resolved per row.
+    """
+    # 兼容不同接口返回的列名 sina/em efinance tushare xtdata
+    code_col = next((c for c in ['代码', '股票代码', 'ts_code', 'stock_code'] if c in df.columns), None)
+    name_col = next((c for c in ['名称', '股票名称', 'name'] if c in df.columns), None)
+    close_col = next((c for c in ['最新价', 'close', 'lastPrice'] if c in df.columns), None)
+    pre_close_col = next((c for c in ['昨收', '昨日收盘', 'pre_close', 'lastClose'] if c in df.columns), None)
+    amount_col = next((c for c in ['成交额', 'amount'] if c in df.columns), None)
+
+    close_raw = df[close_col]
+    pre_close_raw = df[pre_close_col]
+    amount_raw = df[amount_col]
+
+    valid = ~(
+        close_raw.isna()
+        | pre_close_raw.isna()
+        | close_raw.eq('-')
+        | pre_close_raw.eq('-')
+        | amount_raw.eq(0)
+    ).to_numpy(dtype=bool)
+
+    # em、efinance 为 str，需要转换为 float
+    current = close_raw[valid].astype(np.float64).to_numpy()
+    pre_close = pre_close_raw[valid].astype(np.float64).to_numpy()
+    ratio = np.fromiter(
+        (
+            _limit_ratio(normalize_stock_code(str(code)), name)
+            for code, name in zip(df[code_col][valid], df[name_col][valid])
+        ),
+        dtype=np.float64,
+        count=len(current),
+    )
+
+    # 严格按照 A 股规则计算涨跌停价：昨收 * (1 ± 比例) -> 四舍五入保留2位小数
+    limit_up_price = np.floor(pre_close * (1 + ratio) * 100 + 0.5) / 100.0
+    limit_down_price = np.floor(pre_close * (1 - ratio) * 100 + 0.5) / 100.0
+    limit_up_tolerance = np.round(np.abs(pre_close * (1 + ratio) - limit_up_price), 10)
+    limit_down_tolerance = np.round(np.abs(pre_close * (1 - ratio) - limit_down_price), 10)
+
+    priced = current > 0
+    rising = priced & (current > pre_close)
+    falling = priced & (current < pre_close)
+
+    return {
+        'up_count': int(rising.sum()),
+        'down_count': int(falling.sum()),
+        'flat_count': int((priced & ~rising & ~falling).sum()),
+        'limit_up_count': int((priced & (np.abs(current - limit_up_price) <= limit_up_tolerance)).sum()),
+        'limit_down_count': int((priced & (np.abs(current - limit_down_price) <= limit_down_tolerance)).sum()),
+        'total_amount': pd.to_numeric(amount_raw, errors='coerce').sum() / 1e8,
+    }
+
+
 class DataFetchError(Exception):
     """数据获取异常基类"""
     pass
@@ -58,9 +58,8 @@ from .base import (
     DataFetchError,
     RateLimitError,
     STANDARD_COLUMNS,
-    is_bse_code,
-    is_st_stock,
-    is_kc_cy_stock,
+    calc_market_stats,
+    find_cached_quote_row,
     normalize_stock_code,
     _is_hk_market,
     _is_etf_code as _is_a_share_etf_code,
@@ -148,6 +147,21 @@ _etf_realtime_cache: Dict[str, Any] = {
 _ETF_SH_PREFIXES = ('51', '52', '56', '58')
 _ETF_SZ_PREFIXES = ('15', '16', '18')
 
+# Column mapping (efinance Chinese column names -> standard English column names)
+_DAILY_COLUMN_MAPPING = {
+    '日期': 'date',
+    '开盘': 'open',
+    '收盘': 'close',
+    '最高': 'high',
+    '最低': 'low',
+    '成交量': 'volume',
+    '成交额': 'amount',
+    '涨跌幅': 'pct_chg',
+    '股票代码': 'code',
+    '股票名称': 'name',
+}
+_DAILY_KEEP_COLUMNS = ('code', *STANDARD_COLUMNS)
+
 
 def _is_etf_code(stock_code: str) -> bool:
     """
@@ -577,24 +591,8 @@ class EfinanceFetcher(BaseFetcher):
         需要映射到标准列名：
         date, open, high, low, close, volume, amount, pct_chg
         """
-        df = df.copy()
-        
-        # Column mapping (efinance Chinese column names -> standard English column names)
-        column_mapping = {
-            '日期': 'date',
-            '开盘': 'open',
-            '收盘': 'close',
-            '最高': 'high',
-            '最低': 'low',
-            '成交量': 'volume',
-            '成交额': 'amount',
-            '涨跌幅': 'pct_chg',
-            '股票代码': 'code',
-            '股票名称': 'name',
-        }
-        
         # 重命名列
-        df = df.rename(columns=column_mapping)
+        df = df.rename(columns=_DAILY_COLUMN_MAPPING)
         
         # Fallback: if OHLC columns are missing (e.g. very old data path), fill from close
         if 'close' in df.columns and 'open' not in df.columns:
@@ -614,8 +612,7 @@ class EfinanceFetcher(BaseFetcher):
             df['code'] = stock_code
         
         # 只保留需要的列
-        keep_cols = ['code'] + STANDARD_COLUMNS
-        existing_cols = [col for col in keep_cols if col in df.columns]
+        existing_cols = [col for col in _DAILY_KEEP_COLUMNS if col in df.columns]
         df = df[existing_cols]
         
         return df
@@ -680,13 +677,11 @@ class EfinanceFetcher(BaseFetcher):
             # 查找指定股票
             # efinance 返回的列名可能是 '股票代码' 或 'code'
             code_col = '股票代码' if '股票代码' in df.columns else 'code'
-            row = df[df[code_col] == stock_code]
-            if row.empty:
+            row = find_cached_quote_row(_realtime_cache, df, code_col, stock_code)
+            if row is None:
                 logger.info(f"[API返回] 未找到股票 {stock_code} 的实时行情")
                 return None
             
-            row = row.iloc[0]
-            
             # 使用 realtime_types.py 中的统一转换函数
             # 获取列名（可能是中文或英文）
             name_col = '股票名称' if '股票名称' in df.columns else 'name'
@@ -954,89 +949,7 @@ class EfinanceFetcher(BaseFetcher):
         df: pd.DataFrame,
         ) -> Optional[Dict[str, Any]]:
         """从行情 DataFrame 计算涨跌统计。"""
-        import numpy as np
-
-        df = df.copy()
-        
-        # 1. 提取基础比对数据：最新价、昨收
-        # 兼容不同接口返回的列名 sina/em efinance tushare xtdata
-        code_col = next((c for c in ['代码', '股票代码', 'ts_code','stock_code'] if c in df.columns), None)
-        name_col = next((c for c in ['名称', '股票名称','name','name'] if c in df.columns), None)
-        close_col = next((c for c in ['最新价', '最新价', 'close','lastPrice'] if c in df.columns), None)
-        pre_close_col = next((c for c in ['昨收', '昨日收盘', 'pre_close','lastClose'] if c in df.columns), None)
-        amount_col = next((c for c in ['成交额', '成交额', 'amount','amount'] if c in df.columns), None) 
-        
-        limit_up_count = 0
-        limit_down_count = 0
-        up_count = 0
-        down_count = 0
-        flat_count = 0
-
-        for code, name, current_price, pre_close, amount in zip(
-            df[code_col], df[name_col], df[close_col], df[pre_close_col], df[amount_col]
-        ):
-            
-            # 停牌过滤 efinance 的停牌数据有时候会缺失价格显示为 '-'，em 显示为none
-            if pd.isna(current_price) or pd.isna(pre_close) or current_price in ['-'] or pre_close in ['-'] or amount == 0:
-                continue
-            
-            # em、efinance 为str 需要转换为float
-            current_price = float(current_price)
-            pre_close = float(pre_close)
-            
-            # 获取去除前缀的纯数字代码
-            pure_code = normalize_stock_code(str(code)) 
-
-            # A. 确定每只股票的涨跌幅比例 (使用纯数字代码判断)
-            if is_bse_code(pure_code): 
-                ratio = 0.30
-            elif is_kc_cy_stock(pure_code): #pure_code.startswith(('688', '30')):
-                ratio = 0.20
-            elif is_st_stock(name): #'ST' in str_name:
-                ratio = 0.05
-            else:
-                ratio = 0.10
-
-            # B. 严格按照 A 股规则计算涨跌停价：昨收 * (1 ± 比例) -> 四舍五入保留2位小数
-            limit_up_price = np.floor(pre_close * (1 + ratio) * 100 + 0.5) / 100.0
-            limit_down_price = np.floor(pre_close * (1 - ratio) * 100 + 0.5) / 100.0
-
-            limit_up_price_Tolerance = round(abs(pre_close * (1 + ratio) - limit_up_price), 10)
-            limit_down_price_Tolerance = round(abs(pre_close * (1 - ratio) - limit_down_price), 10)
-
-            # C. 精确比对
-            if current_price > 0 :
-                is_limit_up = (current_price > 0) and (abs(current_price - limit_up_price) <= limit_up_price_Tolerance)
-                is_limit_down = (current_price > 0) and (abs(current_price - limit_down_price) <= limit_down_price_Tolerance)
-
-                if is_limit_up:
-                    limit_up_count += 1
-                if is_limit_down:
-                    limit_down_count += 1
-
-                if current_price > pre_close:
-                    up_count += 1
-                elif current_price < pre_close:
-                    down_count += 1
-                else:
-                    flat_count += 1
-                
-        # 统计数量
-        stats = {
-            'up_count': up_count,
-            'down_count': down_count,
-            'flat_count': flat_count,
-            'limit_up_count': limit_up_count,
-            'limit_down_count': limit_down_count,
-            'total_amount': 0.0,
-        }
-        
-        # 成交额统计
-        if amount_col and amount_col in df.columns:
-            df[amount_col] = pd.to_numeric(df[amount_col], errors='coerce')
-            stats['total_amount'] = (df[amount_col].sum() / 1e8)
-            
-        return stats
+        return calc_market_stats(df)
 
     def get_sector_rankings(self, n: int = 5) -> Optional[Tuple[List[Dict], List[Dict]]]:
         """
@@ -384,8 +384,6 @@ class PytdxFetcher(BaseFetcher):
         需要映射到标准列名：
         date, open, high, low, close, volume, amount, pct_chg
         """
-        df = df.copy()
-        
         # 列名映射
         column_mapping = {
             'datetime': 'date',
@@ -15,6 +15,7 @@
 """
 
 import logging
+import math
 import time
 from threading import RLock
 from dataclasses import dataclass, field
@@ -58,16 +59,12 @@ def safe_float(val: Any, default: Optional[float] = None) -> Optional[float]:
             if val == "" or val == "-" or val == "--":
                 return default
         
+        result = float(val)
         # 处理 pandas/numpy NaN
         # 使用 math.isnan 而不是 pd.isna，避免强制依赖 pandas
-        import math
-        try:
-            if math.isnan(float(val)):
-                return default
-        except (ValueError, TypeError):
-            pass
-        
-        return float(val)
+        if math.isnan(result):
+            return default
+        return result
     except (ValueError, TypeError):
         return default
 
@@ -105,6 +102,18 @@ class RealtimeSource(Enum):
     FALLBACK = "fallback"           # 降级兜底
 
 
+# UnifiedRealtimeQuote.to_dict 中按需输出（非 None 才写入）的字段，顺序即输出顺序
+_QUOTE_OPTIONAL_FIELDS = (
+    'fetched_at', 'provider_timestamp', 'is_stale', 'stale_seconds',
+    'fallback_from',
+    'price', 'change_pct', 'change_amount', 'volume', 'amount',
+    'volume_ratio', 'turnover_rate', 'amplitude',
+    'open_price', 'high', 'low', 'pre_close',
+    'pe_ratio', 'pb_ratio', 'total_mv', 'circ_mv',
+    'change_60d', 'high_52w', 'low_52w',
+)
+
+
 @dataclass
 class UnifiedRealtimeQuote:
     """
@@ -162,18 +171,10 @@ class UnifiedRealtimeQuote:
             'name': self.name,
             'source': self.source.value,
         }
-        # 只添加非 None 的字段
-        optional_fields = [
-            'fetched_at', 'provider_timestamp', 'is_stale', 'stale_seconds',
-            'fallback_from',
-            'price', 'change_pct', 'change_amount', 'volume', 'amount',
-            'volume_ratio', 'turnover_rate', 'amplitude',
-            'open_price', 'high', 'low', 'pre_close',
-            'pe_ratio', 'pb_ratio', 'total_mv', 'circ_mv',
-            'change_60d', 'high_52w', 'low_52w'
-        ]
-        for f in optional_fields:
-            val = getattr(self, f, None)
+        # 只添加非 None 的字段；字段均为实例属性，直接查 __dict__ 省去逐个 getattr
+        values = self.__dict__
+        for f in _QUOTE_OPTIONAL_FIELDS:
+            val = values.get(f)
             if val is not None:
                 result[f] = val
         return result
@@ -6,6 +6,7 @@ Tools:
 - analyze_trend: comprehensive technical trend analysis
 """
 
+import heapq
 import logging
 from typing import Optional
 
@@ -431,7 +432,7 @@ def _handle_analyze_pattern(stock_code: str, days: int = 60) -> dict:
 
     # --- Chart patterns over the window ---
     # Double bottom detection (简化版: 两个相近低点 + 中间高点)
-    recent_lows_idx = sorted(range(n), key=lambda i: l[i])[:5]
+    recent_lows_idx = heapq.nsmallest(5, range(n), key=l.__getitem__)
     if len(recent_lows_idx) >= 2:
         lo1, lo2 = sorted(recent_lows_idx[:2])
         if lo2 - lo1 >= 5 and abs(l[lo1] - l[lo2]) / max(l[lo1], l[lo2]) < 0.03:
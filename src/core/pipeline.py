@@ -11,7 +11,9 @@ A股自选股智能分析系统 - 核心分析流水线
 4. 提供股票分析的核心功能
 """
 
+import bisect
 import logging
+import re
 import threading
 import time
 import uuid
@@ -23,7 +25,7 @@ from typing import List, Dict, Any, Optional, Tuple, Callable
 import pandas as pd
 
 from src.config import FUNDAMENTAL_STAGE_TIMEOUT_SECONDS_DEFAULT, get_config, Config
-from src.storage import get_db
+from src.storage import StockDaily, get_db
 from data_provider import DataFetcherManager
 from data_provider.base import normalize_stock_code
 from data_provider.news_fetcher import NewsFetcher
@@ -31,6 +33,8 @@ from data_provider.realtime_types import ChipDistribution
 from src.analyzer import (
     GeminiAnalyzer,
     AnalysisResult,
+    apply_placeholder_fill,
+    check_content_integrity,
     fill_price_position_if_needed,
     normalize_chip_structure_availability,
     populate_decision_action_fields,
@@ -49,6 +53,11 @@ from src.analysis_context_pack_prompt import format_analysis_context_pack_prompt
 from src.analysis_context_pack_overview import render_analysis_context_pack_overview
 from src.market_phase_summary import MARKET_PHASE_SUMMARY_KEY, render_market_phase_summary
 from src.phase_decision_guardrail import apply_phase_decision_guardrails
+from src.services.history_loader import (
+    get_frozen_target_date,
+    reset_frozen_target_date,
+    set_frozen_target_date,
+)
 from src.services.social_sentiment_service import SocialSentimentService
 from src.services.analysis_context_builder import (
     AnalysisContextBuilder,
@@ -83,6 +92,27 @@ logger = logging.getLogger(__name__)
 # double-check 初始化 _single_stock_notify_lock 仍然线程安全。
 _SINGLE_STOCK_NOTIFY_LOCK_INIT_GUARD = threading.Lock()
 
+# 量比分档：阈值左闭右开，_VOLUME_RATIO_LABELS 比阈值多一档（>= 最后一个阈值）
+_VOLUME_RATIO_BOUNDS = (0.5, 0.8, 1.2, 2.0, 3.0)
+_VOLUME_RATIO_LABELS = ("极度萎缩", "明显萎缩", "正常", "温和放量", "明显放量", "巨量")
+
+# _enhance_context 中 realtime 段按原样透传的行情字段（分组保持输出顺序）
+_REALTIME_PRICE_FIELDS = ('price', 'change_pct')
+_REALTIME_VALUATION_FIELDS = (
+    'turnover_rate', 'pe_ratio', 'pb_ratio', 'total_mv', 'circ_mv', 'change_60d',
+)
+_REALTIME_META_FIELDS = (
+    'fetched_at', 'provider_timestamp', 'is_stale', 'stale_seconds', 'fallback_from',
+)
+
+
+def _copy_present_attrs(target: Dict[str, Any], source: Any, fields: Tuple[str, ...]) -> None:
+    """将 source 上非 None 的属性按 fields 顺序写入 target"""
+    for field_name in fields:
+        value = getattr(source, field_name, None)
+        if value is not None:
+            target[field_name] = value
+
 
 class StockAnalysisPipeline:
     """
@@ -409,14 +439,13 @@ class StockAnalysisPipeline:
             # Step 3: 趋势分析（基于交易理念）— 在 Agent 分支之前执行，供两条路径共用
             trend_result: Optional[TrendAnalysisResult] = None
             try:
-                from src.services.history_loader import get_frozen_target_date
                 _mkt = get_market_for_stock(normalize_stock_code(code))
                 frozen = get_frozen_target_date()
                 end_date = frozen if frozen else get_market_now(_mkt).date()
                 start_date = end_date - timedelta(days=89)  # ~60 trading days for MA60
                 historical_bars = self.db.get_data_range(code, start_date, end_date)
                 if historical_bars:
-                    df = pd.DataFrame([bar.to_dict() for bar in historical_bars])
+                    df = StockDaily.to_frame(historical_bars)
                     # Issue #234: Augment with realtime for intraday MA calculation
                     if self.config.enable_realtime_quote and realtime_quote:
                         df = self._augment_historical_with_realtime(df, realtime_quote, code)
@@ -475,16 +504,13 @@ class StockAnalysisPipeline:
                     # 保存新闻情报到数据库（用于后续复盘与查询）
                     try:
                         query_context = self._build_query_context(query_id=query_id)
-                        for dim_name, response in intel_results.items():
-                            if response and response.success and response.results:
-                                self.db.save_news_intel(
-                                    code=code,
-                                    name=stock_name,
-                                    dimension=dim_name,
-                                    query=response.query,
-                                    response=response,
-                                    query_context=query_context
-                                )
+                        # 所有维度在同一个写事务中落库，避免每个维度各自提交一次
+                        self.db.save_news_intel_many(
+                            code=code,
+                            name=stock_name,
+                            responses=intel_results,
+                            query_context=query_context
+                        )
                     except Exception as e:
                         logger.warning(f"{stock_name}({code}) 保存新闻情报失败: {e}")
             else:
@@ -739,27 +765,20 @@ class StockAnalysisPipeline:
             quote_source = getattr(realtime_quote, 'source', None)
             quote_source_name = getattr(quote_source, 'value', quote_source)
             quote_source_name = str(quote_source_name) if quote_source_name is not None else None
-            enhanced['realtime'] = {
-                'name': getattr(realtime_quote, 'name', ''),
-                'price': getattr(realtime_quote, 'price', None),
-                'change_pct': getattr(realtime_quote, 'change_pct', None),
-                'volume_ratio': volume_ratio,
-                'volume_ratio_desc': self._describe_volume_ratio(volume_ratio) if volume_ratio else '无数据',
-                'turnover_rate': getattr(realtime_quote, 'turnover_rate', None),
-                'pe_ratio': getattr(realtime_quote, 'pe_ratio', None),
-                'pb_ratio': getattr(realtime_quote, 'pb_ratio', None),
-                'total_mv': getattr(realtime_quote, 'total_mv', None),
-                'circ_mv': getattr(realtime_quote, 'circ_mv', None),
-                'change_60d': getattr(realtime_quote, 'change_60d', None),
-                'source': quote_source_name,
-                'fetched_at': getattr(realtime_quote, 'fetched_at', None),
-                'provider_timestamp': getattr(realtime_quote, 'provider_timestamp', None),
-                'is_stale': getattr(realtime_quote, 'is_stale', None),
-                'stale_seconds': getattr(realtime_quote, 'stale_seconds', None),
-                'fallback_from': getattr(realtime_quote, 'fallback_from', None),
-            }
-            # 移除 None 值以减少上下文大小
-            enhanced['realtime'] = {k: v for k, v in enhanced['realtime'].items() if v is not None}
+            # 逐字段写入并跳过 None 值以减少上下文大小；写入顺序即输出字段顺序
+            realtime: Dict[str, Any] = {}
+            name = getattr(realtime_quote, 'name', '')
+            if name is not None:
+                realtime['name'] = name
+            _copy_present_attrs(realtime, realtime_quote, _REALTIME_PRICE_FIELDS)
+            if volume_ratio is not None:
+                realtime['volume_ratio'] = volume_ratio
+            realtime['volume_ratio_desc'] = self._describe_volume_ratio(volume_ratio) if volume_ratio else '无数据'
+            _copy_present_attrs(realtime, realtime_quote, _REALTIME_VALUATION_FIELDS)
+            if quote_source_name is not None:
+                realtime['source'] = quote_source_name
+            _copy_present_attrs(realtime, realtime_quote, _REALTIME_META_FIELDS)
+            enhanced['realtime'] = realtime
         
         # 添加筹码分布
         if chip_data:
@@ -963,8 +982,6 @@ class StockAnalysisPipeline:
 
     def _ensure_agent_history(self, code: str, min_days: int = 240) -> None:
         """Ensure at least *min_days* of K-line history is in DB for agent tools."""
-        from src.services.history_loader import get_frozen_target_date
-
         target = get_frozen_target_date()
         if target is None:
             target = self._resolve_resume_target_date(code)
@@ -1124,8 +1141,6 @@ class StockAnalysisPipeline:
                 result.query_id = query_id
             # Agent weak integrity: placeholder fill only, no LLM retry
             if result and getattr(self.config, "report_integrity_enabled", False):
-                from src.analyzer import check_content_integrity, apply_placeholder_fill
-
                 pass_integrity, missing = check_content_integrity(
                     result,
                     require_phase_decision=isinstance(market_phase_summary, dict),
@@ -1761,7 +1776,6 @@ class StockAnalysisPipeline:
         if isinstance(value, float):
             return int(value)
         if isinstance(value, str):
-            import re
             match = re.search(r'-?\d+', value)
             if match:
                 return int(match.group())
@@ -1773,18 +1787,7 @@ class StockAnalysisPipeline:
         
         量比 = 当前成交量 / 过去5日平均成交量
         """
-        if volume_ratio < 0.5:
-            return "极度萎缩"
-        elif volume_ratio < 0.8:
-            return "明显萎缩"
-        elif volume_ratio < 1.2:
-            return "正常"
-        elif volume_ratio < 2.0:
-            return "温和放量"
-        elif volume_ratio < 3.0:
-            return "明显放量"
-        else:
-            return "巨量"
+        return _VOLUME_RATIO_LABELS[bisect.bisect_right(_VOLUME_RATIO_BOUNDS, volume_ratio)]
 
     @staticmethod
     def _compute_ma_status(close: float, ma5: float, ma10: float, ma20: float) -> str:
@@ -2144,14 +2147,17 @@ class StockAnalysisPipeline:
         """
         if value is None:
             return None
-        if hasattr(value, "to_dict"):
+        # 行情/筹码/趋势结果都自带按已知字段构造的 to_dict，只做一次属性查找
+        to_dict = getattr(value, "to_dict", None)
+        if to_dict is not None:
             try:
-                return value.to_dict()
+                return to_dict()
             except Exception:
                 return None
-        if hasattr(value, "__dict__"):
+        attrs = getattr(value, "__dict__", None)
+        if attrs is not None:
             try:
-                return dict(value.__dict__)
+                return dict(attrs)
             except Exception:
                 return None
         return None
@@ -2203,6 +2209,23 @@ class StockAnalysisPipeline:
 
         return context
     
+    def _process_single_stock_after(
+        self,
+        not_before: float,
+        code: str,
+        **kwargs: Any,
+    ) -> Optional[AnalysisResult]:
+        """
+        等到 time.monotonic() 达到 not_before 后再处理单只股票（Issue #128 分析间隔）
+
+        在工作线程内等待，主线程的结果收集与单股通知不受分析间隔影响。
+        """
+        wait_seconds = not_before - time.monotonic()
+        if wait_seconds > 0:
+            logger.debug(f"[{code}] 等待 {wait_seconds:.1f} 秒后开始分析...")
+            time.sleep(wait_seconds)
+        return self.process_single_stock(code, **kwargs)
+
     def process_single_stock(
         self,
         code: str,
@@ -2236,7 +2259,6 @@ class StockAnalysisPipeline:
         """
         logger.info(f"========== 开始处理 {code} ==========")
 
-        from src.services.history_loader import set_frozen_target_date, reset_frozen_target_date
         frozen_td = self._resolve_resume_target_date(code, current_time=current_time)
         token = set_frozen_target_date(frozen_td)
         effective_query_id = analysis_query_id or getattr(self, "query_id", None) or uuid.uuid4().hex
@@ -2380,21 +2402,31 @@ class StockAnalysisPipeline:
         # 注意：max_workers 设置较低（默认3）以避免触发反爬
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             # 提交任务
-            future_to_code = {
-                executor.submit(
-                    self.process_single_stock,
-                    code,
+            # Issue #128: 分析间隔按任务启动时间错峰（第 i 只股票不早于 i * analysis_delay 秒后启动），
+            # 收集循环不再 sleep，避免阻塞单股通知发送。
+            submit_started = time.monotonic()
+            future_to_code = {}
+            for idx, code in enumerate(stock_codes):
+                task_kwargs = dict(
                     skip_analysis=dry_run,
                     single_stock_notify=False,
                     report_type=report_type,  # Issue #119: 传递报告类型
                     analysis_query_id=uuid.uuid4().hex,
                     current_time=resume_reference_time,
-                ): code
-                for code in stock_codes
-            }
+                )
+                if idx > 0 and analysis_delay > 0:
+                    future = executor.submit(
+                        self._process_single_stock_after,
+                        submit_started + idx * analysis_delay,
+                        code,
+                        **task_kwargs,
+                    )
+                else:
+                    future = executor.submit(self.process_single_stock, code, **task_kwargs)
+                future_to_code[future] = code
             
             # 收集结果
-            for idx, future in enumerate(as_completed(future_to_code)):
+            for future in as_completed(future_to_code):
                 code = future_to_code[future]
                 try:
                     result = future.result()
@@ -2412,15 +2444,6 @@ class StockAnalysisPipeline:
                             f"{result.error_message or '未知原因'}"
                         )
 
-                    # Issue #128: 分析间隔 - 在个股分析和大盘分析之间添加延迟
-                    if idx < len(stock_codes) - 1 and analysis_delay > 0:
-                        # 注意：此 sleep 发生在“主线程收集 future 的循环”中，
-                        # 并不会阻止线程池中的任务同时发起网络请求。
-                        # 因此它对降低并发请求峰值的效果有限；真正的峰值主要由 max_workers 决定。
-                        # 该行为目前保留（按需求不改逻辑）。
-                        logger.debug(f"等待 {analysis_delay} 秒后继续下一只股票...")
-                        time.sleep(analysis_delay)
-
                 except Exception as e:
                     logger.error(f"[{code}] 任务执行失败: {e}")
         
@@ -13,6 +13,7 @@ A股自选股智能分析系统 - 搜索服务模块
 注意：Bocha、Tavily、Brave 等接口已禁用（不稳定）
 """
 
+import heapq
 import logging
 import re
 import threading
@@ -2465,7 +2466,7 @@ class SearchService:
                 # Second pass: if still over limit, evict oldest entries (FIFO)
                 if len(self._cache) >= _MAX_CACHE_SIZE:
                     excess = len(self._cache) - _MAX_CACHE_SIZE + 1
-                    oldest = sorted(self._cache.keys(), key=lambda k: self._cache[k][0])[:excess]
+                    oldest = heapq.nsmallest(excess, self._cache, key=lambda k: self._cache[k][0])
                     for k in oldest:
                         self._cache.pop(k, None)
             self._cache[key] = (time.time(), response)
@@ -101,9 +101,10 @@ def _get_akshare_name_to_code() -> Optional[Dict[str, str]]:
         if df is None or df.empty:
             return None
         code_to_name = {}
-        for _, row in df.iterrows():
-            code = row.get("code")
-            name = row.get("name")
+        codes = df.get("code")
+        names = df.get("name")
+        pairs = zip(codes.tolist(), names.tolist()) if codes is not None and names is not None else ()
+        for code, name in pairs:
             if code is None or name is None:
                 continue
             code_str = str(code).strip()
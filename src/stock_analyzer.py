@@ -18,7 +18,7 @@
 
 import logging
 from dataclasses import dataclass, field
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from enum import Enum
 
 import pandas as pd
@@ -29,6 +29,31 @@ from src.config import get_config
 logger = logging.getLogger(__name__)
 
 
+def _float_column(df: pd.DataFrame, column: str) -> np.ndarray:
+    """取出 float64、C 连续的列数组；列本身已是 float64 时直接返回视图，不复制"""
+    return np.ascontiguousarray(df[column].to_numpy(dtype=np.float64, copy=False))
+
+
+def _ewm_mean(values: np.ndarray, com: float) -> np.ndarray:
+    """
+    递推计算 EMA，等价于 pd.Series(values).ewm(com=com, adjust=False).mean()
+
+    日线序列通常只有几十到一两百根，逐点递推的开销远小于每次构造 pandas
+    EWM 窗口对象；平滑系数与 pandas 一样由 com 换算，保证结果逐位一致。
+    序列含 NaN 时回退 pandas 实现，沿用其缺失值加权口径。
+    """
+    if values.size == 0 or np.isnan(values).any():
+        return pd.Series(values).ewm(com=com, adjust=False).mean().to_numpy()
+    alpha = 1.0 / (1.0 + com)
+    decay = 1.0 - alpha
+    out = values.tolist()
+    prev = out[0]
+    for i in range(1, len(out)):
+        prev = alpha * out[i] + decay * prev
+        out[i] = prev
+    return np.asarray(out, dtype=np.float64)
+
+
 class TrendStatus(Enum):
     """趋势状态枚举"""
     STRONG_BULL = "强势多头"      # MA5 > MA10 > MA20，且间距扩大
@@ -168,6 +193,44 @@ class TrendAnalysisResult:
         }
 
 
+# _generate_signal 各维度的状态 -> 得分查表（模块级常量，避免每次评分重建 dict）
+_TREND_SCORES = {
+    TrendStatus.STRONG_BULL: 30,
+    TrendStatus.BULL: 26,
+    TrendStatus.WEAK_BULL: 18,
+    TrendStatus.CONSOLIDATION: 12,
+    TrendStatus.WEAK_BEAR: 8,
+    TrendStatus.BEAR: 4,
+    TrendStatus.STRONG_BEAR: 0,
+}
+
+_VOLUME_SCORES = {
+    VolumeStatus.SHRINK_VOLUME_DOWN: 15,  # 缩量回调最佳
+    VolumeStatus.HEAVY_VOLUME_UP: 12,     # 放量上涨次之
+    VolumeStatus.NORMAL: 10,
+    VolumeStatus.SHRINK_VOLUME_UP: 6,     # 无量上涨较差
+    VolumeStatus.HEAVY_VOLUME_DOWN: 0,    # 放量下跌最差
+}
+
+_MACD_SCORES = {
+    MACDStatus.GOLDEN_CROSS_ZERO: 15,  # 零轴上金叉最强
+    MACDStatus.GOLDEN_CROSS: 12,      # 金叉
+    MACDStatus.CROSSING_UP: 10,       # 上穿零轴
+    MACDStatus.BULLISH: 8,            # 多头
+    MACDStatus.BEARISH: 2,            # 空头
+    MACDStatus.CROSSING_DOWN: 0,       # 下穿零轴
+    MACDStatus.DEATH_CROSS: 0,        # 死叉
+}
+
+_RSI_SCORES = {
+    RSIStatus.OVERSOLD: 10,       # 超卖最佳
+    RSIStatus.STRONG_BUY: 8,     # 强势
+    RSIStatus.NEUTRAL: 5,        # 中性
+    RSIStatus.WEAK: 3,            # 弱势
+    RSIStatus.OVERBOUGHT: 0,       # 超买最差
+}
+
+
 class StockTrendAnalyzer:
     """
     股票趋势分析器
@@ -220,15 +283,21 @@ class StockTrendAnalyzer:
             result.risk_factors.append("数据不足，无法完成分析")
             return result
         
-        # 确保数据按日期排序
-        df = df.sort_values('date').reset_index(drop=True)
+        # 确保数据按日期排序；数据库/数据源返回的 K 线通常已升序，此时跳过排序与重建索引的整表复制
+        if not df['date'].is_monotonic_increasing:
+            df = df.sort_values('date')
+        if not df.index.equals(pd.RangeIndex(len(df))):
+            df = df.reset_index(drop=True)
         
+        # 收盘价数组只取一次，供均线 / MACD / RSI 共用
+        close = _float_column(df, 'close')
+
         # 计算均线
-        df = self._calculate_mas(df)
+        df = self._calculate_mas(df, close=close)
 
         # 计算 MACD 和 RSI
-        df = self._calculate_macd(df)
-        df = self._calculate_rsi(df)
+        df = self._calculate_macd(df, close=close)
+        df = self._calculate_rsi(df, close=close)
 
         # 获取最新数据
         latest = df.iloc[-1]
@@ -261,19 +330,24 @@ class StockTrendAnalyzer:
 
         return result
     
-    def _calculate_mas(self, df: pd.DataFrame) -> pd.DataFrame:
-        """计算均线"""
+    def _calculate_mas(self, df: pd.DataFrame, close: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """计算均线（close 为调用方已取出的收盘价数组，缺省时从 df 读取）"""
         df = df.copy()
-        df['MA5'] = df['close'].rolling(window=5).mean()
-        df['MA10'] = df['close'].rolling(window=10).mean()
-        df['MA20'] = df['close'].rolling(window=20).mean()
+        if close is None:
+            close = _float_column(df, 'close')
+        # 均线沿用 pandas rolling：其窗口求和逐窗口维护，平盘序列的均值与收盘价逐位相等，
+        # 下游 price >= MA5、MA5 > MA10 > MA20 等精确比较依赖这一点（前缀和相减会引入误差）
+        close_series = pd.Series(close, index=df.index, copy=False)
+        df['MA5'] = close_series.rolling(window=5).mean()
+        df['MA10'] = close_series.rolling(window=10).mean()
+        df['MA20'] = close_series.rolling(window=20).mean()
         if len(df) >= 60:
-            df['MA60'] = df['close'].rolling(window=60).mean()
+            df['MA60'] = close_series.rolling(window=60).mean()
         else:
             df['MA60'] = df['MA20']  # 数据不足时使用 MA20 替代
         return df
 
-    def _calculate_macd(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _calculate_macd(self, df: pd.DataFrame, close: Optional[np.ndarray] = None) -> pd.DataFrame:
         """
         计算 MACD 指标
 
@@ -286,22 +360,27 @@ class StockTrendAnalyzer:
         """
         df = df.copy()
 
-        # 计算快慢线 EMA
-        ema_fast = df['close'].ewm(span=self.MACD_FAST, adjust=False).mean()
-        ema_slow = df['close'].ewm(span=self.MACD_SLOW, adjust=False).mean()
+        # 计算快慢线 EMA（span 口径换算为 com = (span - 1) / 2）
+        if close is None:
+            close = _float_column(df, 'close')
+        ema_fast = _ewm_mean(close, (self.MACD_FAST - 1) / 2)
+        ema_slow = _ewm_mean(close, (self.MACD_SLOW - 1) / 2)
 
         # 计算快线 DIF
-        df['MACD_DIF'] = ema_fast - ema_slow
+        dif = ema_fast - ema_slow
 
         # 计算信号线 DEA
-        df['MACD_DEA'] = df['MACD_DIF'].ewm(span=self.MACD_SIGNAL, adjust=False).mean()
+        dea = _ewm_mean(dif, (self.MACD_SIGNAL - 1) / 2)
+
+        df['MACD_DIF'] = dif
+        df['MACD_DEA'] = dea
 
         # 计算柱状图
-        df['MACD_BAR'] = (df['MACD_DIF'] - df['MACD_DEA']) * 2
+        df['MACD_BAR'] = (dif - dea) * 2
 
         return df
 
-    def _calculate_rsi(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _calculate_rsi(self, df: pd.DataFrame, close: Optional[np.ndarray] = None) -> pd.DataFrame:
         """
         计算 RSI 指标（Wilder's EMA / SMMA 口径）
 
@@ -312,21 +391,25 @@ class StockTrendAnalyzer:
         """
         df = df.copy()
 
-        for period in [self.RSI_SHORT, self.RSI_MID, self.RSI_LONG]:
-            # 计算价格变化
-            delta = df['close'].diff()
-
-            # 分离上涨和下跌
-            gain = delta.where(delta > 0, 0)
-            loss = -delta.where(delta < 0, 0)
+        # 价格变化与涨跌拆分只依赖收盘价，三个周期共用一次 numpy 计算结果；
+        # 首日 delta 为 NaN，与 Series.diff + where 口径一致地记为 0
+        if close is None:
+            close = _float_column(df, 'close')
+        delta = np.diff(close, prepend=np.nan)
+        gain = np.where(delta > 0, delta, 0.0)
+        loss = np.where(delta < 0, -delta, 0.0)
 
+        for period in [self.RSI_SHORT, self.RSI_MID, self.RSI_LONG]:
             # 使用 Wilder's EMA / SMMA 口径，与常见 RSI 图表工具保持一致。
-            avg_gain = gain.ewm(alpha=1 / period, adjust=False).mean()
-            avg_loss = loss.ewm(alpha=1 / period, adjust=False).mean()
+            # alpha = 1/period 对应 com = period - 1（与 pandas 的换算一致）
+            com = (1 - 1 / period) / (1 / period)
+            avg_gain = _ewm_mean(gain, com)
+            avg_loss = _ewm_mean(loss, com)
 
-            # 计算 RS 和 RSI
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
+            # 计算 RS 和 RSI（0/0 得到 NaN，由下方 fillna 处理）
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rs = avg_gain / avg_loss
+            rsi = pd.Series(100 - (100 / (1 + rs)), index=df.index)
 
             # 填充 NaN 值
             rsi = rsi.fillna(50)  # 默认中性值
@@ -598,16 +681,7 @@ class StockTrendAnalyzer:
         risks = []
 
         # === 趋势评分（30分）===
-        trend_scores = {
-            TrendStatus.STRONG_BULL: 30,
-            TrendStatus.BULL: 26,
-            TrendStatus.WEAK_BULL: 18,
-            TrendStatus.CONSOLIDATION: 12,
-            TrendStatus.WEAK_BEAR: 8,
-            TrendStatus.BEAR: 4,
-            TrendStatus.STRONG_BEAR: 0,
-        }
-        trend_score = trend_scores.get(result.trend_status, 12)
+        trend_score = _TREND_SCORES.get(result.trend_status, 12)
         score += trend_score
 
         if result.trend_status in [TrendStatus.STRONG_BULL, TrendStatus.BULL]:
@@ -664,14 +738,7 @@ class StockTrendAnalyzer:
             )
 
         # === 量能评分（15分）===
-        volume_scores = {
-            VolumeStatus.SHRINK_VOLUME_DOWN: 15,  # 缩量回调最佳
-            VolumeStatus.HEAVY_VOLUME_UP: 12,     # 放量上涨次之
-            VolumeStatus.NORMAL: 10,
-            VolumeStatus.SHRINK_VOLUME_UP: 6,     # 无量上涨较差
-            VolumeStatus.HEAVY_VOLUME_DOWN: 0,    # 放量下跌最差
-        }
-        vol_score = volume_scores.get(result.volume_status, 8)
+        vol_score = _VOLUME_SCORES.get(result.volume_status, 8)
         score += vol_score
 
         if result.volume_status == VolumeStatus.SHRINK_VOLUME_DOWN:
@@ -688,16 +755,7 @@ class StockTrendAnalyzer:
             reasons.append("✅ MA10支撑有效")
 
         # === MACD 评分（15分）===
-        macd_scores = {
-            MACDStatus.GOLDEN_CROSS_ZERO: 15,  # 零轴上金叉最强
-            MACDStatus.GOLDEN_CROSS: 12,      # 金叉
-            MACDStatus.CROSSING_UP: 10,       # 上穿零轴
-            MACDStatus.BULLISH: 8,            # 多头
-            MACDStatus.BEARISH: 2,            # 空头
-            MACDStatus.CROSSING_DOWN: 0,       # 下穿零轴
-            MACDStatus.DEATH_CROSS: 0,        # 死叉
-        }
-        macd_score = macd_scores.get(result.macd_status, 5)
+        macd_score = _MACD_SCORES.get(result.macd_status, 5)
         score += macd_score
 
         if result.macd_status in [MACDStatus.GOLDEN_CROSS_ZERO, MACDStatus.GOLDEN_CROSS]:
@@ -708,14 +766,7 @@ class StockTrendAnalyzer:
             reasons.append(result.macd_signal)
 
         # === RSI 评分（10分）===
-        rsi_scores = {
-            RSIStatus.OVERSOLD: 10,       # 超卖最佳
-            RSIStatus.STRONG_BUY: 8,     # 强势
-            RSIStatus.NEUTRAL: 5,        # 中性
-            RSIStatus.WEAK: 3,            # 弱势
-            RSIStatus.OVERBOUGHT: 0,       # 超买最差
-        }
-        rsi_score = rsi_scores.get(result.rsi_status, 5)
+        rsi_score = _RSI_SCORES.get(result.rsi_status, 5)
         score += rsi_score
 
         if result.rsi_status in [RSIStatus.OVERSOLD, RSIStatus.STRONG_BUY]:
@@ -22,6 +22,7 @@ import time
 from datetime import datetime, date, timedelta
 from typing import Optional, List, Dict, Any, TYPE_CHECKING, Tuple, Callable, TypeVar, Union
 
+import numpy as np
 import pandas as pd
 from sqlalchemy import (
     create_engine,
@@ -148,6 +149,33 @@ class StockDaily(Base):
             'data_source': self.data_source,
         }
 
+    # to_frame 输出的列（顺序与 to_dict 一致）及其中按 float64 构造的数值列
+    FRAME_COLUMNS = (
+        'code', 'date', 'open', 'high', 'low', 'close', 'volume', 'amount',
+        'pct_chg', 'ma5', 'ma10', 'ma20', 'volume_ratio', 'data_source',
+    )
+    FRAME_NUMERIC_COLUMNS = frozenset((
+        'open', 'high', 'low', 'close', 'volume', 'amount',
+        'pct_chg', 'ma5', 'ma10', 'ma20', 'volume_ratio',
+    ))
+
+    @classmethod
+    def to_frame(cls, bars: List['StockDaily']) -> pd.DataFrame:
+        """
+        按列批量转换为 DataFrame
+
+        等价于 pd.DataFrame([bar.to_dict() for bar in bars])，但逐列收集后直接构造
+        float64 数组，避免逐行建 dict 和按行推断 dtype；缺失值统一为 NaN
+        （整列为空时也是 float64 而非 object）。
+        """
+        data = {}
+        for column in cls.FRAME_COLUMNS:
+            values = [getattr(bar, column) for bar in bars]
+            if column in cls.FRAME_NUMERIC_COLUMNS:
+                values = np.array(values, dtype=np.float64)
+            data[column] = values
+        return pd.DataFrame(data, copy=False)
+
 
 class NewsIntel(Base):
     """
@@ -1138,113 +1166,188 @@ class DatabaseManager(metaclass=_DatabaseManagerMeta):
         if not response or not response.results:
             return 0
 
-        saved_count = 0
-        query_ctx = query_context or {}
-        current_query_id = (query_ctx.get("query_id") or "").strip()
-
-        def _write(session: Session) -> int:
-            local_saved_count = 0
-
-            for item in response.results:
-                title = (item.title or '').strip()
-                url = (item.url or '').strip()
-                source = (item.source or '').strip()
-                snippet = (item.snippet or '').strip()
-                published_date = self._parse_published_date(item.published_date)
+        try:
+            saved_count = self._run_write_transaction(
+                f"save_news_intel[{code}]",
+                lambda session: self._write_news_intel_response(
+                    session,
+                    code=code,
+                    name=name,
+                    dimension=dimension,
+                    query=query,
+                    response=response,
+                    query_context=query_context,
+                ),
+            )
+            logger.info(f"保存新闻情报成功: {code}, 新增 {saved_count} 条")
+        except Exception as e:
+            logger.error(f"保存新闻情报失败: {e}")
+            raise
 
-                if not title and not url:
-                    continue
+        return saved_count
 
-                url_key = url or self._build_fallback_url_key(
-                    code=code,
-                    title=title,
-                    source=source,
-                    published_date=published_date
-                )
+    def save_news_intel_many(
+        self,
+        code: str,
+        name: str,
+        responses: Dict[str, 'SearchResponse'],
+        query_context: Optional[Dict[str, str]] = None
+    ) -> int:
+        """
+        在同一个写事务中保存多个维度的新闻情报
 
-                existing = session.execute(
-                    select(NewsIntel).where(NewsIntel.url == url_key)
-                ).scalar_one_or_none()
+        与逐维度调用 save_news_intel 的去重/关联策略一致，但只获取一次写锁、
+        提交一次（SQLite 下每只股票只 fsync 一次）；任一维度写入失败时整体回滚。
 
-                if existing:
-                    existing.name = name or existing.name
-                    existing.dimension = dimension or existing.dimension
-                    existing.query = query or existing.query
-                    existing.provider = response.provider or existing.provider
-                    existing.snippet = snippet or existing.snippet
-                    existing.source = source or existing.source
-                    existing.published_date = published_date or existing.published_date
-                    existing.fetched_at = datetime.now()
-
-                    if query_context:
-                        if not existing.query_id and current_query_id:
-                            existing.query_id = current_query_id
-                        existing.query_source = (
-                            query_context.get("query_source") or existing.query_source
-                        )
-                        existing.requester_platform = (
-                            query_context.get("requester_platform") or existing.requester_platform
-                        )
-                        existing.requester_user_id = (
-                            query_context.get("requester_user_id") or existing.requester_user_id
-                        )
-                        existing.requester_user_name = (
-                            query_context.get("requester_user_name") or existing.requester_user_name
-                        )
-                        existing.requester_chat_id = (
-                            query_context.get("requester_chat_id") or existing.requester_chat_id
-                        )
-                        existing.requester_message_id = (
-                            query_context.get("requester_message_id") or existing.requester_message_id
-                        )
-                        existing.requester_query = (
-                            query_context.get("requester_query") or existing.requester_query
-                        )
-                    continue
+        Args:
+            code: 股票代码
+            name: 股票名称
+            responses: 维度名 -> 搜索结果（查询词取自 response.query），
+                失败或无结果的维度会被跳过
+            query_context: 用户查询信息
 
-                try:
-                    with session.begin_nested():
-                        record = NewsIntel(
-                            code=code,
-                            name=name,
-                            dimension=dimension,
-                            query=query,
-                            provider=response.provider,
-                            title=title,
-                            snippet=snippet,
-                            url=url_key,
-                            source=source,
-                            published_date=published_date,
-                            fetched_at=datetime.now(),
-                            query_id=current_query_id or None,
-                            query_source=query_ctx.get("query_source"),
-                            requester_platform=query_ctx.get("requester_platform"),
-                            requester_user_id=query_ctx.get("requester_user_id"),
-                            requester_user_name=query_ctx.get("requester_user_name"),
-                            requester_chat_id=query_ctx.get("requester_chat_id"),
-                            requester_message_id=query_ctx.get("requester_message_id"),
-                            requester_query=query_ctx.get("requester_query"),
-                        )
-                        session.add(record)
-                        session.flush()
-                    local_saved_count += 1
-                except IntegrityError:
-                    logger.debug("新闻情报重复（已跳过）: %s %s", code, url_key)
+        Returns:
+            新增条数
+        """
+        pending = [
+            (dimension, response)
+            for dimension, response in responses.items()
+            if response and response.success and response.results
+        ]
+        if not pending:
+            return 0
 
-            return local_saved_count
+        def _write(session: Session) -> int:
+            return sum(
+                self._write_news_intel_response(
+                    session,
+                    code=code,
+                    name=name,
+                    dimension=dimension,
+                    query=response.query,
+                    response=response,
+                    query_context=query_context,
+                )
+                for dimension, response in pending
+            )
 
         try:
             saved_count = self._run_write_transaction(
-                f"save_news_intel[{code}]",
+                f"save_news_intel_many[{code}]",
                 _write,
             )
-            logger.info(f"保存新闻情报成功: {code}, 新增 {saved_count} 条")
+            logger.info(f"保存新闻情报成功: {code}, {len(pending)} 个维度, 新增 {saved_count} 条")
         except Exception as e:
             logger.error(f"保存新闻情报失败: {e}")
             raise
 
         return saved_count
 
+    def _write_news_intel_response(
+        self,
+        session: Session,
+        *,
+        code: str,
+        name: str,
+        dimension: str,
+        query: str,
+        response: 'SearchResponse',
+        query_context: Optional[Dict[str, str]],
+    ) -> int:
+        """在给定写事务内写入单个搜索结果的新闻条目，返回新增条数"""
+        query_ctx = query_context or {}
+        current_query_id = (query_ctx.get("query_id") or "").strip()
+
+        saved_count = 0
+
+        for item in response.results:
+            title = (item.title or '').strip()
+            url = (item.url or '').strip()
+            source = (item.source or '').strip()
+            snippet = (item.snippet or '').strip()
+            published_date = self._parse_published_date(item.published_date)
+
+            if not title and not url:
+                continue
+
+            url_key = url or self._build_fallback_url_key(
+                code=code,
+                title=title,
+                source=source,
+                published_date=published_date
+            )
+
+            existing = session.execute(
+                select(NewsIntel).where(NewsIntel.url == url_key)
+            ).scalar_one_or_none()
+
+            if existing:
+                existing.name = name or existing.name
+                existing.dimension = dimension or existing.dimension
+                existing.query = query or existing.query
+                existing.provider = response.provider or existing.provider
+                existing.snippet = snippet or existing.snippet
+                existing.source = source or existing.source
+                existing.published_date = published_date or existing.published_date
+                existing.fetched_at = datetime.now()
+
+                if query_context:
+                    if not existing.query_id and current_query_id:
+                        existing.query_id = current_query_id
+                    existing.query_source = (
+                        query_context.get("query_source") or existing.query_source
+                    )
+                    existing.requester_platform = (
+                        query_context.get("requester_platform") or existing.requester_platform
+                    )
+                    existing.requester_user_id = (
+                        query_context.get("requester_user_id") or existing.requester_user_id
+                    )
+                    existing.requester_user_name = (
+                        query_context.get("requester_user_name") or existing.requester_user_name
+                    )
+                    existing.requester_chat_id = (
+                        query_context.get("requester_chat_id") or existing.requester_chat_id
+                    )
+                    existing.requester_message_id = (
+                        query_context.get("requester_message_id") or existing.requester_message_id
+                    )
+                    existing.requester_query = (
+                        query_context.get("requester_query") or existing.requester_query
+                    )
+                continue
+
+            try:
+                with session.begin_nested():
+                    record = NewsIntel(
+                        code=code,
+                        name=name,
+                        dimension=dimension,
+                        query=query,
+                        provider=response.provider,
+                        title=title,
+                        snippet=snippet,
+                        url=url_key,
+                        source=source,
+                        published_date=published_date,
+                        fetched_at=datetime.now(),
+                        query_id=current_query_id or None,
+                        query_source=query_ctx.get("query_source"),
+                        requester_platform=query_ctx.get("requester_platform"),
+                        requester_user_id=query_ctx.get("requester_user_id"),
+                        requester_user_name=query_ctx.get("requester_user_name"),
+                        requester_chat_id=query_ctx.get("requester_chat_id"),
+                        requester_message_id=query_ctx.get("requester_message_id"),
+                        requester_query=query_ctx.get("requester_query"),
+                    )
+                    session.add(record)
+                    session.flush()
+                saved_count += 1
+            except IntegrityError:
+                logger.debug("新闻情报重复（已跳过）: %s %s", code, url_key)
+
+        return saved_count
+
     def save_fundamental_snapshot(
         self,
         query_id: str,
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the shared A-share market breadth calculation used by the
+akshare / efinance / tushare fetchers.
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from data_provider.base import calc_market_stats
+
+
+class TestCalcMarketStats(unittest.TestCase):
+    def test_calculates_a_share_limit_rules(self):
+        df = pd.DataFrame(
+            [
+                ("600000", "浦发银行", 11.0, 10.0, 1e8),
+                ("300750", "宁德时代", 12.0, 10.0, 1e8),
+                ("688001", "科创测试", 8.0, 10.0, 1e8),
+                ("bj920001", "北交测试", 13.0, 10.0, 1e8),
+                ("600001", "*ST示例", 10.5, 10.0, 1e8),
+                ("600002", "平盘示例", 10.0, 10.0, 1e8),
+                ("600003", "零成交额", 11.0, 10.0, 0.0),
+                ("600004", "缺昨收", 11.0, np.nan, 1e8),
+            ],
+            columns=["代码", "名称", "最新价", "昨收", "成交额"],
+        )
+
+        stats = calc_market_stats(df)
+
+        self.assertEqual(stats["up_count"], 4)
+        self.assertEqual(stats["down_count"], 1)
+        self.assertEqual(stats["flat_count"], 1)
+        self.assertEqual(stats["limit_up_count"], 4)
+        self.assertEqual(stats["limit_down_count"], 1)
+        self.assertAlmostEqual(stats["total_amount"], 7.0)
+
+    def test_string_prices_and_placeholders(self):
+        df = pd.DataFrame(
+            {
+                "ts_code": ["600000.SH", "000001.SZ", "000002.SZ", "000003.SZ"],
+                "name": ["浦发银行", "平安银行", "万科A", "停牌示例"],
+                "close": ["11.0", "9.5", "0", "-"],
+                "pre_close": ["10.0", "10.0", "10.0", "10.0"],
+                "amount": [1e8, 1e8, 1e8, 1e8],
+            }
+        )
+
+        stats = calc_market_stats(df)
+
+        self.assertEqual(stats["up_count"], 1)
+        self.assertEqual(stats["down_count"], 1)
+        self.assertEqual(stats["flat_count"], 0)
+        self.assertEqual(stats["limit_up_count"], 1)
+        self.assertEqual(stats["limit_down_count"], 0)
+        self.assertAlmostEqual(stats["total_amount"], 4.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
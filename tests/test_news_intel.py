@@ -199,6 +199,58 @@ class NewsIntelStorageTestCase(unittest.TestCase):
             total = session.query(NewsIntel).count()
         self.assertEqual(total, 1)
 
+    def test_save_news_intel_many_writes_all_dimensions_in_one_transaction(self) -> None:
+        """多维度情报一次事务落库，跳过失败/空结果维度并保持 URL 去重"""
+        shared = SearchResult(
+            title="茅台发布新产品",
+            snippet="公司发布新品...",
+            url="https://news.example.com/shared",
+            source="example.com",
+            published_date="2025-01-02",
+        )
+        risk = SearchResult(
+            title="茅台风险提示",
+            snippet="监管关注...",
+            url="https://news.example.com/risk",
+            source="example.com",
+            published_date="2025-01-03",
+        )
+        failed = SearchResponse(query="失败查询", results=[risk], provider="Bocha", success=False)
+        responses = {
+            "latest_news": self._build_response([shared]),
+            "risk_check": self._build_response([shared, risk]),
+            "earnings": self._build_response([]),
+            "announcements": failed,
+            "industry": None,
+        }
+
+        with patch.object(self.db, "_run_write_transaction", wraps=self.db._run_write_transaction) as run_write:
+            saved = self.db.save_news_intel_many(
+                code="600519",
+                name="贵州茅台",
+                responses=responses,
+                query_context={"query_id": "task_002"},
+            )
+
+        self.assertEqual(saved, 2)
+        run_write.assert_called_once()
+        with self.db.get_session() as session:
+            rows = {row.url: row for row in session.query(NewsIntel).all()}
+        self.assertEqual(set(rows), {shared.url, risk.url})
+        self.assertEqual(rows[risk.url].dimension, "risk_check")
+        self.assertEqual(rows[shared.url].query_id, "task_002")
+
+    def test_save_news_intel_many_skips_transaction_without_results(self) -> None:
+        with patch.object(self.db, "_run_write_transaction") as run_write:
+            saved = self.db.save_news_intel_many(
+                code="600519",
+                name="贵州茅台",
+                responses={"latest_news": self._build_response([])},
+            )
+
+        self.assertEqual(saved, 0)
+        run_write.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the analysis_delay pacing of task starts in StockAnalysisPipeline.run.
+"""
+
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.litellm_stub import ensure_litellm_stub
+
+ensure_litellm_stub()
+
+from src.core.pipeline import StockAnalysisPipeline
+
+
+def _make_pipeline(max_workers: int = 2) -> StockAnalysisPipeline:
+    pipeline = StockAnalysisPipeline.__new__(StockAnalysisPipeline)
+    pipeline.max_workers = max_workers
+    return pipeline
+
+
+def _make_run_pipeline(analysis_delay: float) -> StockAnalysisPipeline:
+    pipeline = _make_pipeline()
+    pipeline.config = SimpleNamespace(
+        single_stock_notify=False,
+        report_type="simple",
+        analysis_delay=analysis_delay,
+    )
+    pipeline.fetcher_manager = MagicMock()
+    pipeline._save_local_report = MagicMock()
+    pipeline._cleanup_old_data = MagicMock()
+    pipeline.process_single_stock = MagicMock(
+        side_effect=lambda code, **kwargs: SimpleNamespace(code=code, success=True)
+    )
+    pipeline._process_single_stock_after = MagicMock(
+        side_effect=lambda not_before, code, **kwargs: SimpleNamespace(code=code, success=True)
+    )
+    return pipeline
+
+
+class TestPipelineAnalysisDelayPacing(unittest.TestCase):
+    def test_task_waits_until_its_start_slot(self):
+        pipeline = _make_pipeline()
+        pipeline.process_single_stock = MagicMock(return_value="result")
+
+        with patch("src.core.pipeline.time.monotonic", return_value=100.0), \
+                patch("src.core.pipeline.time.sleep") as mock_sleep:
+            result = pipeline._process_single_stock_after(103.5, "600519", skip_analysis=True)
+
+        self.assertEqual(result, "result")
+        mock_sleep.assert_called_once_with(3.5)
+        pipeline.process_single_stock.assert_called_once_with("600519", skip_analysis=True)
+
+    def test_task_past_its_start_slot_runs_immediately(self):
+        pipeline = _make_pipeline()
+        pipeline.process_single_stock = MagicMock(return_value="result")
+
+        with patch("src.core.pipeline.time.monotonic", return_value=100.0), \
+                patch("src.core.pipeline.time.sleep") as mock_sleep:
+            pipeline._process_single_stock_after(99.0, "600519")
+
+        mock_sleep.assert_not_called()
+        pipeline.process_single_stock.assert_called_once_with("600519")
+
+    def test_run_schedules_task_starts_without_sleeping_in_collection(self):
+        pipeline = _make_run_pipeline(analysis_delay=2.0)
+        codes = ["600519", "000001", "300750"]
+
+        with patch("src.core.pipeline.time.monotonic", return_value=100.0), \
+                patch("src.core.pipeline.time.sleep") as mock_sleep:
+            results = pipeline.run(stock_codes=codes, send_notification=False)
+
+        self.assertEqual(sorted(r.code for r in results), sorted(codes))
+        mock_sleep.assert_not_called()
+        self.assertEqual(pipeline.process_single_stock.call_count, 1)
+        self.assertEqual(pipeline.process_single_stock.call_args.args, ("600519",))
+        scheduled = sorted(c.args[:2] for c in pipeline._process_single_stock_after.call_args_list)
+        self.assertEqual(scheduled, [(102.0, "000001"), (104.0, "300750")])
+
+    def test_run_without_delay_submits_every_task_directly(self):
+        pipeline = _make_run_pipeline(analysis_delay=0)
+        codes = ["600519", "000001", "300750"]
+
+        with patch("src.core.pipeline.time.sleep") as mock_sleep:
+            pipeline.run(stock_codes=codes, send_notification=False)
+
+        mock_sleep.assert_not_called()
+        pipeline._process_single_stock_after.assert_not_called()
+        self.assertEqual(
+            sorted(c.args[0] for c in pipeline.process_single_stock.call_args_list),
+            sorted(codes),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
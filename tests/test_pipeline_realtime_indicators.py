@@ -5,6 +5,7 @@ Issue #234 盘中实时技术指标的单元测试。
 覆盖范围：
 - _augment_historical_with_realtime：追加/更新逻辑和防护条件
 - _compute_ma_status：均线排列文案
+- _describe_volume_ratio：量比分档文案
 - _enhance_context：使用 realtime + trend_result 覆盖 today
 """
 
@@ -174,6 +175,20 @@ class TestComputeMaStatus(unittest.TestCase):
         self.assertIn("震荡", status)
 
 
+class TestDescribeVolumeRatio(unittest.TestCase):
+    """_describe_volume_ratio 分档边界的测试。"""
+
+    def test_bucket_boundaries_are_left_closed(self) -> None:
+        pipeline = StockAnalysisPipeline.__new__(StockAnalysisPipeline)
+        cases = [
+            (0.49, "极度萎缩"), (0.5, "明显萎缩"), (0.8, "正常"),
+            (1.2, "温和放量"), (2.0, "明显放量"), (2.99, "明显放量"), (3.0, "巨量"),
+        ]
+        for ratio, expected in cases:
+            with self.subTest(ratio=ratio):
+                self.assertEqual(pipeline._describe_volume_ratio(ratio), expected)
+
+
 class TestEnhanceContextRealtimeOverride(unittest.TestCase):
     """_enhance_context 使用实时行情和趋势结果覆盖 today 的测试。"""
 
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the per-frame code index used to look up rows in cached
+full-market realtime quote frames.
+"""
+
+import os
+import sys
+import unittest
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from data_provider.base import find_cached_quote_row
+
+
+def _spot_frame(codes, prices):
+    return pd.DataFrame({"代码": codes, "名称": [f"股票{c}" for c in codes], "最新价": prices})
+
+
+class TestFindCachedQuoteRow(unittest.TestCase):
+    def test_returns_first_matching_row_and_reuses_index(self):
+        df = _spot_frame(["600519", "000001", "600519"], [1800.0, 10.5, 1.0])
+        cache = {"data": df}
+
+        row = find_cached_quote_row(cache, df, "代码", "600519")
+        index_entry = cache["code_index"]
+        missing = find_cached_quote_row(cache, df, "代码", "300750")
+
+        self.assertEqual(row["最新价"], 1800.0)
+        self.assertIsNone(missing)
+        self.assertIs(cache["code_index"], index_entry)
+
+    def test_rebuilds_index_when_cache_frame_is_refreshed(self):
+        old_df = _spot_frame(["600519"], [1800.0])
+        cache = {"data": old_df}
+        find_cached_quote_row(cache, old_df, "代码", "600519")
+
+        new_df = _spot_frame(["000001", "600519"], [10.5, 1810.0])
+        cache["data"] = new_df
+        row = find_cached_quote_row(cache, new_df, "代码", "600519")
+
+        self.assertEqual(row["最新价"], 1810.0)
+        self.assertIs(cache["code_index"][0], new_df)
+
+
+if __name__ == "__main__":
+    unittest.main()
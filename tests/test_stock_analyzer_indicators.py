@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""Indicator kernels and input-ordering tests for StockTrendAnalyzer."""
+
+import math
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.stock_analyzer import StockTrendAnalyzer, _ewm_mean
+
+
+def _make_daily_df(days: int = 90) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    close = 10 + np.cumsum(rng.normal(0, 0.2, days))
+    return pd.DataFrame({
+        "date": pd.date_range("2024-01-01", periods=days, freq="D"),
+        "open": close - 0.05,
+        "high": close + 0.1,
+        "low": close - 0.1,
+        "close": close,
+        "volume": rng.uniform(1e6, 2e6, days),
+    })
+
+
+def _make_price_df(close: np.ndarray) -> pd.DataFrame:
+    days = len(close)
+    return pd.DataFrame({
+        "date": pd.date_range("2024-01-01", periods=days, freq="D"),
+        "open": close,
+        "high": close + 0.01,
+        "low": close - 0.01,
+        "close": close,
+        "volume": np.full(days, 1.5e6),
+    })
+
+
+class _PandasRollingAnalyzer(StockTrendAnalyzer):
+    """均线按 DataFrame 列直接 rolling 计算的参考实现"""
+
+    def _calculate_mas(self, df, close=None):
+        df = df.copy()
+        for window in (5, 10, 20):
+            df[f"MA{window}"] = df["close"].rolling(window=window).mean()
+        df["MA60"] = df["close"].rolling(window=60).mean() if len(df) >= 60 else df["MA20"]
+        return df
+
+
+class IndicatorKernelTestCase(unittest.TestCase):
+    def test_ewm_mean_matches_pandas_adjust_false(self) -> None:
+        close = _make_daily_df()["close"].to_numpy()
+
+        for com in ((12 - 1) / 2, (26 - 1) / 2, 5.0):
+            with self.subTest(com=com):
+                expected = pd.Series(close).ewm(com=com, adjust=False).mean().to_numpy()
+                np.testing.assert_array_equal(_ewm_mean(close, com), expected)
+
+    def test_ewm_mean_falls_back_to_pandas_for_nan(self) -> None:
+        values = np.array([1.0, np.nan, 3.0, 4.0])
+
+        expected = pd.Series(values).ewm(com=2.0, adjust=False).mean().to_numpy()
+        np.testing.assert_array_equal(_ewm_mean(values, 2.0), expected)
+
+
+class MovingAverageParityTestCase(unittest.TestCase):
+    def test_flat_prices_keep_exact_ma_support(self) -> None:
+        result = StockTrendAnalyzer().analyze(_make_price_df(np.full(90, 10.23)), "600519")
+
+        self.assertEqual((result.ma5, result.ma10, result.ma20), (10.23, 10.23, 10.23))
+        self.assertTrue(result.support_ma5)
+        self.assertTrue(result.support_ma10)
+        self.assertEqual(
+            result.to_dict(),
+            _PandasRollingAnalyzer().analyze(_make_price_df(np.full(90, 10.23)), "600519").to_dict(),
+        )
+
+    def test_tick_stepped_prices_match_pandas_rolling_exactly(self) -> None:
+        rng = np.random.default_rng(11)
+        analyzer = StockTrendAnalyzer()
+        reference = _PandasRollingAnalyzer()
+
+        for case in range(50):
+            steps = rng.integers(-2, 3, 90) * 0.01
+            close = np.round(rng.uniform(2, 12) + np.cumsum(steps), 2).clip(min=0.5)
+            with self.subTest(case=case):
+                df = _make_price_df(close)
+                self.assertEqual(analyzer.analyze(df, "600519").to_dict(), reference.analyze(df, "600519").to_dict())
+
+
+class AnalyzeInputOrderingTestCase(unittest.TestCase):
+    def test_unsorted_input_is_analyzed_in_date_order(self) -> None:
+        analyzer = StockTrendAnalyzer()
+        df = _make_daily_df()
+        shuffled = df.sample(frac=1.0, random_state=3)
+
+        expected = analyzer.analyze(df, "600519").to_dict()
+        actual = analyzer.analyze(shuffled, "600519").to_dict()
+
+        for key, value in expected.items():
+            with self.subTest(key=key):
+                if isinstance(value, float):
+                    self.assertTrue(math.isclose(actual[key], value, rel_tol=1e-9))
+                else:
+                    self.assertEqual(actual[key], value)
+
+    def test_sorted_input_is_not_mutated(self) -> None:
+        df = _make_daily_df()
+        original_columns = list(df.columns)
+
+        StockTrendAnalyzer().analyze(df, "600519")
+
+        self.assertEqual(list(df.columns), original_columns)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -86,7 +86,26 @@ class TestStorage(unittest.TestCase):
 
         DatabaseManager.reset_instance()
         temp_dir.cleanup()
-    
+
+    def test_stock_daily_to_frame_matches_to_dict_rows(self):
+        """测试 StockDaily.to_frame 与逐行 to_dict 构造的 DataFrame 一致"""
+        bars = [
+            StockDaily(code='600519', date=date(2024, 1, 2), open=10.0, high=11.0, low=9.5,
+                       close=10.5, volume=1000.0, amount=None, pct_chg=1.0, data_source='Akshare'),
+            StockDaily(code='600519', date=date(2024, 1, 3), open=10.5, high=11.5, low=10.0,
+                       close=11.0, volume=1200.0, amount=13200.0, pct_chg=None, data_source='Akshare'),
+        ]
+
+        frame = StockDaily.to_frame(bars)
+
+        self.assertEqual(list(frame.columns), list(bars[0].to_dict()))
+        expected = pd.DataFrame([bar.to_dict() for bar in bars]).astype(
+            {column: 'float64' for column in StockDaily.FRAME_NUMERIC_COLUMNS}
+        )
+        pd.testing.assert_frame_equal(frame, expected)
+        self.assertEqual(frame['ma5'].dtype, 'float64')
+        self.assertTrue(StockDaily.to_frame([]).empty)
+
     def test_parse_sniper_value(self):
         """测试解析狙击点位数值"""
         